@@ -5,7 +5,11 @@ Per the `tutorial`_, this will:
 
 * Ensure the tests can pass *without* mutations
 * Create DB and populate with mutations to apply
-* Work through the mutations and re-run the tests for each one
+* Optionally skip all but a ``MUTATION_SAMPLE`` fraction of the mutations,
+  chosen deterministically
+* Work through the mutations and re-run the tests for each one, in
+  parallel across ``MUTATION_WORKERS`` copies of the project (defaulting
+  to the CPU count) when the local distributor is configured
 * Show report in text and HTML formats
 
 .. _Cosmic Ray: https://cosmic-ray.readthedocs.io/en/latest/index.html
@@ -14,30 +18,55 @@ Per the `tutorial`_, this will:
 """
 
 import logging
+import multiprocessing
+import os
 import pathlib
+import random
+import shutil
 import tempfile
 from argparse import Namespace
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager, redirect_stdout
 from io import StringIO
+from sqlite3 import Connection
+from typing import TYPE_CHECKING
 
 import tqdm
-import yattag
+from attrs import evolve
 from cosmic_ray import commands
 from cosmic_ray.config import ConfigDict, load_config
+from cosmic_ray.distribution.distributor import Distributor
+from cosmic_ray.mutating import mutate_and_test
 from cosmic_ray.plugins import get_distributor
+from cosmic_ray.testing import run_tests
 from cosmic_ray.tools.filters.operators_filter import OperatorsFilter
 from cosmic_ray.tools.filters.pragma_no_mutate import PragmaNoMutateFilter
 from cosmic_ray.tools.html import _generate_html_report
-from cosmic_ray.tools.survival_rate import kills_count, survival_rate
-from cosmic_ray.work_db import WorkDB, use_db
-from cosmic_ray.work_item import TestOutcome, WorkItem, WorkResult
+from cosmic_ray.work_db import WorkDB, _work_result_to_storage, use_db
+from cosmic_ray.work_item import (
+    MutationSpec,
+    TestOutcome,
+    WorkerOutcome,
+    WorkItem,
+    WorkResult,
+)
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+    import yattag
 
 ROOT = (pathlib.Path(__file__).parent / "..").resolve()
 CONFIG_FILE = ROOT / "cosmic-ray.toml"
 MUTATION_DIR = ROOT / "mutation"
-
-MUTATION_DIR.mkdir(exist_ok=True)
+RESULT_BATCH_SIZE = 100
+SAMPLE_RATE = float(os.environ.get("MUTATION_SAMPLE", "1.0"))
+WORKERS = int(os.environ.get("MUTATION_WORKERS", os.cpu_count() or 1))
+WORKER_COPY_IGNORE = shutil.ignore_patterns(
+    ".git", ".venv", "__pycache__", "coverage", "mutation"
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -60,6 +89,144 @@ def temporary_log_level(level: int, *, name: str | None = None) -> Iterator[None
     logger_.setLevel(original_level)
 
 
+def _set_write_pragmas(connection: Connection, _: object) -> None:
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA busy_timeout=5000")
+
+
+def tune_for_writes(db: WorkDB, /) -> None:
+    """Use WAL journaling without a sync on every commit for the work DB."""
+    engine = db._engine  # noqa: SLF001
+    event.listen(engine, "connect", _set_write_pragmas)
+    # drop pooled connections, so every connection gets the pragmas
+    engine.dispose()
+
+
+@contextmanager
+def batched_results(
+    db: WorkDB, /, *, size: int
+) -> Iterator[Callable[[str, WorkResult], None]]:
+    """Record results in batches of the given size, rather than one by one."""
+    pending: list[tuple[str, WorkResult]] = []
+
+    def flush() -> None:
+        with db._session_maker.begin() as session:  # noqa: SLF001
+            for job_id, result in pending:
+                session.merge(_work_result_to_storage(result, job_id))
+        pending.clear()
+
+    def record(job_id: str, result: WorkResult) -> None:
+        pending.append((job_id, result))
+        if len(pending) >= size:
+            flush()
+
+    try:
+        yield record
+    finally:
+        flush()
+
+
+def _mutation_key(work_item: WorkItem) -> tuple[tuple[str, str, int], ...]:
+    return tuple(
+        (str(mutation.module_path), mutation.operator_name, mutation.occurrence)
+        for mutation in work_item.mutations
+    )
+
+
+def sample_work(db: WorkDB, /, *, rate: float, seed: int = 0) -> None:
+    """Skip a repeatable random sample of the pending work, keeping ``rate``."""
+    # pending work comes back shuffled, with new job IDs from every init, so
+    # draw over the mutations in a stable order
+    work_items = sorted(db.pending_work_items, key=_mutation_key)
+    rng = random.Random(seed)  # noqa: S311
+    job_ids = [item.job_id for item in work_items if rng.random() >= rate]
+    if job_ids:
+        db.set_multiple_results(
+            job_ids,
+            WorkResult(output="Sampled out", worker_outcome=WorkerOutcome.SKIPPED),
+        )
+
+
+def tested_results(db: WorkDB, /) -> list[WorkResult]:
+    """Return the results of the mutants that weren't skipped."""
+    # skipped results have no test outcome, which Cosmic Ray counts as killed
+    return [
+        result
+        for _, result in db.results
+        if result.worker_outcome != WorkerOutcome.SKIPPED
+    ]
+
+
+def _enter_worker_copy(copies: "Queue[pathlib.Path]", test_command: str) -> None:
+    os.chdir(copies.get())
+    # the first run also creates the copy's own environment, so isn't timed
+    test_outcome, output = run_tests(test_command, None)
+    if test_outcome == TestOutcome.KILLED:
+        raise RuntimeError(output)
+
+
+def _mutate_and_test_copy(
+    mutations: Iterable[MutationSpec], test_command: str, timeout: float
+) -> WorkResult:
+    # module paths are recorded under ROOT, point them into the worker's copy
+    return mutate_and_test(
+        mutations=[
+            evolve(mutation, module_path=mutation.module_path.relative_to(ROOT))
+            for mutation in mutations
+        ],
+        test_command=test_command,
+        timeout=timeout,
+    )
+
+
+class ParallelDistributor(Distributor):
+    """Run mutants concurrently, each worker process in its own project copy.
+
+    Cosmic Ray applies mutations to the files in place and runs the tests
+    in the current directory, so workers can't share a checkout.
+
+    """
+
+    def __init__(self, *, workers: int) -> None:
+        """Create the distributor with the given number of worker processes."""
+        self.workers = workers
+
+    def __call__(
+        self,
+        pending_work: Iterable[WorkItem],
+        test_command: str,
+        timeout: float,
+        distributor_config: ConfigDict,  # noqa: ARG002
+        on_task_complete: Callable[[str, WorkResult], None],
+    ) -> None:
+        """Distribute the pending work across the worker processes."""
+        context = multiprocessing.get_context("spawn")
+        copies: Queue[pathlib.Path] = context.Queue()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(self.workers):
+                copy = pathlib.Path(temp_dir) / f"worker-{index}"
+                shutil.copytree(ROOT, copy, ignore=WORKER_COPY_IGNORE)
+                copies.put(copy)
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_enter_worker_copy,
+                initargs=(copies, test_command),
+            ) as executor:
+                jobs = {
+                    executor.submit(
+                        _mutate_and_test_copy,
+                        work_item.mutations,
+                        test_command,
+                        timeout,
+                    ): work_item.job_id
+                    for work_item in pending_work
+                }
+                for job in as_completed(jobs):
+                    on_task_complete(jobs[job], job.result())
+
+
 def baseline(config: ConfigDict, /) -> None:
     """Ensure the tests can pass via Cosmic Ray before mutating."""
     with (
@@ -80,54 +247,75 @@ def baseline(config: ConfigDict, /) -> None:
             raise RuntimeError("test baseline failed")  # noqa: EM101, TRY003
 
 
-baseline(config_dict)
+def main() -> None:
+    """Run the full analysis and write the HTML report."""
+    MUTATION_DIR.mkdir(exist_ok=True)
+    baseline(config_dict)
 
-with use_db(MUTATION_DIR / "state.sqlite", mode=WorkDB.Mode.create) as work_db:
-    commands.init(
-        module_paths=modules,
-        operator_cfgs=config_dict.operators_config,
-        work_db=work_db,
-    )
+    with use_db(MUTATION_DIR / "state.sqlite", mode=WorkDB.Mode.create) as work_db:
+        tune_for_writes(work_db)
+        commands.init(
+            module_paths=modules,
+            operator_cfgs=config_dict.operators_config,
+            work_db=work_db,
+        )
 
-    args = Namespace(config=str(CONFIG_FILE))
-    # Operators filter uses the root logger
-    with temporary_log_level(logging.WARNING):
-        OperatorsFilter().filter(work_db, args)
-    # Pragma filter uses print
-    with redirect_stdout(StringIO()):
-        PragmaNoMutateFilter().filter(work_db, args)
+        args = Namespace(config=str(CONFIG_FILE))
+        # Operators filter uses the root logger
+        with temporary_log_level(logging.WARNING):
+            OperatorsFilter().filter(work_db, args)
+        # Pragma filter uses print
+        with redirect_stdout(StringIO()):
+            PragmaNoMutateFilter().filter(work_db, args)
+        if SAMPLE_RATE < 1:
+            sample_work(work_db, rate=SAMPLE_RATE)
 
-    distributor = get_distributor(config_dict.distributor_name)
+        distributor = (
+            ParallelDistributor(workers=WORKERS)
+            if config_dict.distributor_name == "local" and WORKERS > 1
+            else get_distributor(config_dict.distributor_name)
+        )
 
-    with tqdm.tqdm(total=work_db.num_work_items) as progress:
+        with (
+            tqdm.tqdm(
+                initial=work_db.num_results, total=work_db.num_work_items
+            ) as progress,
+            batched_results(work_db, size=RESULT_BATCH_SIZE) as record_result,
+        ):
 
-        def on_task_complete(job_id: str, work_result: WorkResult) -> None:
-            work_db.set_result(job_id, work_result)
-            progress.update(work_db.num_results - progress.n)
+            def on_task_complete(job_id: str, work_result: WorkResult) -> None:
+                record_result(job_id, work_result)
+                progress.update()
 
-        distributor(
-            work_db.pending_work_items,
-            config_dict.test_command,
-            config_dict.timeout,
-            config_dict.distributor_config,
-            on_task_complete=on_task_complete,
+            distributor(
+                work_db.pending_work_items,
+                config_dict.test_command,
+                config_dict.timeout,
+                config_dict.distributor_config,
+                on_task_complete=on_task_complete,
+            )
+
+        results = tested_results(work_db)
+        kills = sum(result.is_killed for result in results)
+        logger.info(
+            "killed %d / %d mutants (survival rate: %.1f%%)",
+            kills,
+            len(results),
+            (1 - kills / len(results)) * 100 if results else 0,
         )
 
-    logger.info(
-        "killed %d / %d mutants (survival rate: %.1f%%)",
-        kills_count(work_db),
-        work_db.num_results,
-        survival_rate(work_db),
-    )
+        report_path = MUTATION_DIR / "index.html"
+        with report_path.open(mode="w") as report:
+            doc: yattag.Doc = _generate_html_report(
+                work_db,
+                hide_skipped=False,
+                only_completed=False,
+                skip_success=False,
+            )
+            report.write(doc.getvalue())
+            logger.info("HTML report created")
+            print(report_path)  # noqa: T201
 
-    report_path = MUTATION_DIR / "index.html"
-    with report_path.open(mode="w") as report:
-        doc: yattag.Doc = _generate_html_report(
-            work_db,
-            hide_skipped=False,
-            only_completed=False,
-            skip_success=False,
-        )
-        report.write(doc.getvalue())
-        logger.info("HTML report created")
-        print(report_path)  # noqa: T201
+
+if __name__ == "__main__":
+    main()
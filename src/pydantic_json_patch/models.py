@@ -3,10 +3,11 @@
 import re
 import typing as tp
 from collections.abc import Iterator, Sequence
-from functools import cached_property, lru_cache
+from functools import lru_cache
 
 import typing_extensions as tx
 from pydantic import (
+    AfterValidator,
     BaseModel,
     ConfigDict,
     Discriminator,
@@ -15,12 +16,16 @@ from pydantic import (
     ValidationInfo,
     model_validator,
 )
+from pydantic_core import PydanticCustomError, PydanticKnownError
 
 _CACHE_SIZE = 1_024  # pragma: no mutate
-_JSON_POINTER = re.compile(r"^(?:/(?:[^/~]|~[01])*)*$")
+_JSON_POINTER = r"^(?:/(?:[^/~]|~[01])*)*$"
+_find_bad_escape = re.compile(r"~(?![01])").search
 
 T = tx.TypeVar("T", default=tp.Any)
 
+_OpName: tp.TypeAlias = tp.Literal["add", "copy", "move", "remove", "replace", "test"]
+
 # region base models
 
 
@@ -33,16 +38,54 @@ def _generate_title(model: type[tp.Any]) -> str:
     return "".join(("JsonPatch", name, "eration", *rest))
 
 
-@lru_cache(maxsize=_CACHE_SIZE)
+def _validate_pointer(pointer: str) -> str:
+    """Check the pointer matches the _JSON_POINTER pattern.
+
+    That is, it is either empty or starts with '/', and every '~' is part of
+    a '~0' or '~1' escape; the regex only runs if a '~' is present.
+
+    """
+    if (pointer and not pointer.startswith("/")) or (
+        "~" in pointer  # pragma: no mutate
+        and _find_bad_escape(pointer) is not None
+    ):
+        error_type = "string_pattern_mismatch"
+        msg = "String should match pattern '{pattern}'"
+        raise PydanticCustomError(error_type, msg, {"pattern": _JSON_POINTER})
+    return pointer
+
+
+_JsonPointer: tp.TypeAlias = tp.Annotated[
+    str,
+    AfterValidator(_validate_pointer),
+    Field(json_schema_extra={"pattern": _JSON_POINTER}),
+]
+
+
 def _decode_token(token: str) -> str:
+    if "~" not in token:  # pragma: no mutate
+        return token
     return token.replace("~1", "/").replace("~0", "~")
 
 
-@lru_cache(maxsize=_CACHE_SIZE)
 def _encode_token(token: str) -> str:
+    if "~" not in token and "/" not in token:  # pragma: no mutate
+        return token
     return token.replace("~", "~0").replace("/", "~1")
 
 
+def _dump_pointer(tokens: Sequence[str]) -> str:
+    return "/".join(["", *[_encode_token(token) for token in tokens]])
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_pointer(pointer: str) -> tuple[str, ...]:
+    tokens = pointer.split("/")[1:]
+    if "~" not in pointer:  # pragma: no mutate
+        return tuple(tokens)
+    return tuple([_decode_token(token) for token in tokens])
+
+
 class _BaseOp(BaseModel):
     model_config = ConfigDict(
         frozen=True,
@@ -50,36 +93,47 @@ class _BaseOp(BaseModel):
         strict=True,
     )
 
+    _op: tp.ClassVar[_OpName]
+
+    # (pointer, tokens) memos, stored in the instance __dict__ on first read;
+    # the class defaults are the root pointer, which has no tokens
+    _path_memo: tp.ClassVar[tuple[str, tuple[str, ...]]] = ("", ())
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: tp.Any) -> None:  # noqa: ANN401
+        """Resolve the operation literal once, rather than on every create."""
+        super().__pydantic_init_subclass__(**kwargs)
+        annotation = cls.model_fields["op"].annotation
+        # the intermediate bases keep the union of all the operation names
+        if annotation is not _OpName:  # pragma: no mutate
+            (cls._op,) = tp.get_args(annotation)
+
     @classmethod
     def create(cls, /, *, path: str | Sequence[str], **kwargs: tp.Any) -> tx.Self:  # noqa: ANN401
         """Return an instance of the appropriate operation."""
-        (op,) = tp.get_args(cls.model_fields["op"].annotation)
-        return cls(op=op, path=cls._dump_pointer(path), **kwargs)
+        pointer = path if isinstance(path, str) else _dump_pointer(path)
+        return cls(op=cls._op, path=pointer, **kwargs)
 
-    op: tp.Literal["add", "copy", "move", "remove", "replace", "test"]
+    op: _OpName
     """The operation being represented."""
 
-    path: str = Field(examples=["/a/b/c"], pattern=_JSON_POINTER)
+    path: tp.Annotated[_JsonPointer, Field(examples=["/a/b/c"])]
     """A JSON pointer representing the path to apply the operation to."""
 
-    @cached_property
+    @property
     def path_tokens(self) -> tuple[str, ...]:
         """The decoded tokens in the 'path' JSON pointer."""
-        return self._load_pointer(self.path)
-
-    @classmethod
-    def _dump_pointer(cls, pointer: Sequence[str]) -> str:
-        if isinstance(pointer, str):
-            return pointer
-        return "/".join(["", *(_encode_token(token) for token in pointer)])
-
-    @staticmethod
-    @lru_cache(maxsize=_CACHE_SIZE)
-    def _load_pointer(pointer: str) -> tuple[str, ...]:
-        return tuple(_decode_token(token) for token in pointer.split("/")[1:])
+        pointer, tokens = self._path_memo
+        if pointer is not self.path:  # pragma: no mutate
+            pointer = self.path
+            tokens = _load_pointer(pointer)
+            self.__dict__["_path_memo"] = (pointer, tokens)
+        return tokens
 
 
 class _FromOp(_BaseOp):
+    _from_memo: tp.ClassVar[tuple[str, tuple[str, ...]]] = ("", ())
+
     @classmethod
     def create(
         cls,
@@ -89,10 +143,10 @@ class _FromOp(_BaseOp):
         from_: str | Sequence[str],
     ) -> tx.Self:  # ty: ignore[invalid-method-override] -- deliberately narrows **kwargs to named params
         """Return an instance of the appropriate operation."""
-        pointer = from_ if isinstance(from_, str) else cls._dump_pointer(from_)
+        pointer = from_ if isinstance(from_, str) else _dump_pointer(from_)
         return super().create(path=path, **{"from": pointer})
 
-    from_: str = Field(alias="from", examples=["/a/b/d"], pattern=_JSON_POINTER)
+    from_: tp.Annotated[_JsonPointer, Field(alias="from", examples=["/a/b/d"])]
     """A JSON pointer representing the path to apply the operation from."""
 
     @model_validator(mode="before")
@@ -107,10 +161,15 @@ class _FromOp(_BaseOp):
             data["from"] = data.pop("from_")
         return data
 
-    @cached_property
+    @property
     def from_tokens(self) -> tuple[str, ...]:
         """The decoded tokens in the 'from' JSON pointer."""
-        return self._load_pointer(self.from_)
+        pointer, tokens = self._from_memo
+        if pointer is not self.from_:  # pragma: no mutate
+            pointer = self.from_
+            tokens = _load_pointer(pointer)
+            self.__dict__["_from_memo"] = (pointer, tokens)
+        return tokens
 
 
 class _ValueOp(_BaseOp, tp.Generic[T]):
@@ -137,7 +196,7 @@ class _ValueOp(_BaseOp, tp.Generic[T]):
 # region public models
 
 
-class AddOp(_ValueOp[T], tp.Generic[T]):
+class AddOp(_ValueOp[T]):
     """Represents the [add] operation.
 
     [add]: https://datatracker.ietf.org/doc/html/rfc6902/#section-4.1
@@ -182,7 +241,7 @@ class RemoveOp(_BaseOp):
     op: tp.Literal["remove"]
 
 
-class ReplaceOp(_ValueOp[T], tp.Generic[T]):
+class ReplaceOp(_ValueOp[T]):
     """Represents the [replace] operation.
 
     [replace]: https://datatracker.ietf.org/doc/html/rfc6902/#section-4.3
@@ -192,7 +251,7 @@ class ReplaceOp(_ValueOp[T], tp.Generic[T]):
     op: tp.Literal["replace"]
 
 
-class TestOp(_ValueOp[T], tp.Generic[T]):
+class TestOp(_ValueOp[T]):
     """Represents the [test] operation.
 
     [test]: https://datatracker.ietf.org/doc/html/rfc6902/#section-4.6
@@ -212,7 +271,7 @@ Operation: tp.TypeAlias = tp.Annotated[
 ]
 
 
-class JsonPatch(RootModel[Sequence[Operation]], Sequence[Operation]):
+class JsonPatch(RootModel[tuple[Operation, ...]], Sequence[Operation]):
     """Represents a full JSON Patch [document].
 
     [document]: https://datatracker.ietf.org/doc/html/rfc6902/#section-3
@@ -223,12 +282,19 @@ class JsonPatch(RootModel[Sequence[Operation]], Sequence[Operation]):
 
     @model_validator(mode="before")
     @classmethod
-    def _coerce_seq_to_tuple(cls, value: tp.Any) -> tp.Any:  # noqa: ANN401
-        if isinstance(value, tuple):
-            return value
+    def _require_sequence(cls, value: tp.Any, info: ValidationInfo) -> tp.Any:  # noqa: ANN401
+        if info.mode == "json":  # pragma: no mutate
+            # arrays are the only JSON sequences; keep the list_type error the
+            # list root reported before, rather than the tuple schema's own
+            if isinstance(value, list):
+                return value
+            error_type = "list_type"
+            raise PydanticKnownError(error_type)
         if isinstance(value, Sequence):
-            return tuple(value)
-        return value
+            return value
+        error_type = "is_instance_of"
+        msg = "Input should be an instance of {class}"
+        raise PydanticCustomError(error_type, msg, {"class": "Sequence"})
 
     @tp.overload
     def __getitem__(self, index: int) -> Operation: ...
@@ -5,7 +5,7 @@ import typing as tp
 import pytest
 from joythief.data_structures import DictContaining
 from joythief.strings import StringMatching
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from pydantic_json_patch import (
     AddOp,
@@ -16,6 +16,7 @@ from pydantic_json_patch import (
     ReplaceOp,
     TestOp,
 )
+from pydantic_json_patch.models import _CACHE_SIZE
 
 ONE_HUNDRED_MILLISECONDS: float = 0.1
 
@@ -28,12 +29,29 @@ def test_generate_title_requires_op_suffix():
         Foo.model_json_schema()
 
 
-def test_add_op_can_be_parsed():
-    op: tp.Literal["add"] = "add"
-    path = "/foo/bar"
-    value = 123
-    json_ = json.dumps({"op": op, "path": path, "value": value})
-    assert AddOp.model_validate_json(json_) == AddOp(op=op, path=path, value=value)
+@pytest.mark.parametrize(
+    ("model", "data"),
+    [
+        pytest.param(AddOp, {"op": "add", "path": "/foo/bar", "value": 123}, id="add"),
+        pytest.param(
+            CopyOp, {"from": "/baz/qux", "op": "copy", "path": "/foo/bar"}, id="copy"
+        ),
+        pytest.param(
+            MoveOp, {"from": "/baz/qux", "op": "move", "path": "/foo/bar"}, id="move"
+        ),
+        pytest.param(RemoveOp, {"op": "remove", "path": "/foo/bar"}, id="remove"),
+        pytest.param(
+            ReplaceOp,
+            {"op": "replace", "path": "/foo/bar", "value": 123},
+            id="replace",
+        ),
+        pytest.param(
+            TestOp, {"op": "test", "path": "/foo/bar", "value": 123}, id="test"
+        ),
+    ],
+)
+def test_op_can_be_parsed(model: type[BaseModel], data: dict[str, tp.Any]):
+    assert model.model_validate_json(json.dumps(data)) == model(**data)
 
 
 def test_add_op_can_be_created():
@@ -46,36 +64,16 @@ def test_add_op_can_be_created():
     )
 
 
-def test_copy_op_can_be_parsed():
-    op: tp.Literal["copy"] = "copy"
-    path = "/foo/bar"
-    from_ = "/baz/qux"
-    json_ = json.dumps({"from": from_, "op": op, "path": path})
-    assert (
-        CopyOp.model_validate_json(json_) == CopyOp(from_=from_, op=op, path=path)  # ty: ignore[missing-argument,unknown-argument] -- ty can't follow the alias
-    )
-
-
 def test_copy_op_can_be_created():
     path = "/foo/bar"
     assert CopyOp.create(path=path, from_=()) == CopyOp(from_="", op="copy", path=path)  # ty: ignore[missing-argument,unknown-argument] -- ty can't follow the alias
 
 
-def test_move_op_can_be_parsed():
-    op: tp.Literal["move"] = "move"
-    path = "/foo/bar"
-    from_ = "/baz/qux"
-    json_ = json.dumps({"from": from_, "op": op, "path": path})
-    assert (
-        MoveOp.model_validate_json(json_) == MoveOp(from_=from_, op=op, path=path)  # ty: ignore[missing-argument,unknown-argument] -- ty can't follow the alias
-    )
-
-
-def test_remove_op_can_be_parsed():
-    op: tp.Literal["remove"] = "remove"
-    path = "/foo/bar"
-    json_ = json.dumps({"op": op, "path": path})
-    assert RemoveOp.model_validate_json(json_) == RemoveOp(op=op, path=path)
+def test_copy_op_requires_from_member_when_parsed():
+    """The Python field name must not be accepted as a JSON member."""
+    json_ = json.dumps({"from_": "/baz/qux", "op": "copy", "path": "/foo/bar"})
+    with pytest.raises(ValidationError, match="Field required"):
+        CopyOp.model_validate_json(json_)
 
 
 @pytest.mark.parametrize(
@@ -93,24 +91,22 @@ def test_remove_op_can_be_created(tokens: str | tuple[str, ...], path: str):
     assert op == RemoveOp(op="remove", path=path)
 
 
-def test_replace_op_can_be_parsed():
-    op: tp.Literal["replace"] = "replace"
-    path = "/foo/bar"
-    value = 123
-    json_ = json.dumps({"op": op, "path": path, "value": value})
-    assert ReplaceOp.model_validate_json(json_) == ReplaceOp(
-        op=op,
-        path=path,
-        value=value,
-    )
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param("/foo", id="string path"),
+        pytest.param(("foo",), id="token path"),
+    ],
+)
+def test_create_validates_from_pointer(path: str | tuple[str, ...]):
+    with pytest.raises(ValidationError) as excinfo:
+        CopyOp.create(path=path, from_="baz/qux")
+    assert [error["loc"] for error in excinfo.value.errors()] == [("from",)]
 
 
-def test_test_op_can_be_parsed():
-    op: tp.Literal["test"] = "test"
-    path = "/foo/bar"
-    value = 123
-    json_ = json.dumps({"op": op, "path": path, "value": value})
-    assert TestOp.model_validate_json(json_) == TestOp(op=op, path=path, value=value)
+def test_create_validates_string_path():
+    with pytest.raises(ValidationError):
+        RemoveOp.create(path="foo/bar")
 
 
 @pytest.mark.parametrize(
@@ -131,30 +127,27 @@ def test_empty_reference_tokens_are_valid(path: str, tokens: tuple[str, ...]):
     assert op.path_tokens == tokens
 
 
+@pytest.mark.parametrize("field", ["from_", "path"])
 @pytest.mark.parametrize(
-    "path",
+    "pointer",
     [
         pytest.param("foo/bar", id="no leading slash"),
         pytest.param("/foo~bar", id="unescaped tilde"),
+        pytest.param("/foo~", id="trailing tilde"),
+        pytest.param("/foo~2bar", id="unknown escape"),
+        pytest.param("\n", id="lone newline"),
     ],
 )
-def test_invalid_path_is_not_allowed(path: str):
-    data = {"op": "remove", "path": path}
+def test_invalid_pointer_is_not_allowed(field: str, pointer: str):
+    data = {"from_": "/baz/qux", "op": "copy", "path": "/foo/bar", field: pointer}
     with pytest.raises(ValidationError):
-        RemoveOp.model_validate(data)
+        CopyOp.model_validate(data)
 
 
-@pytest.mark.parametrize(
-    "from_",
-    [
-        pytest.param("foo/bar", id="no leading slash"),
-        pytest.param("/foo~bar", id="unescaped tilde"),
-    ],
-)
-def test_invalid_from_is_not_allowed(from_: str):
-    data = {"from_": from_, "op": "copy", "path": "/foo/bar"}
-    with pytest.raises(ValidationError):
-        CopyOp.model_validate(data)
+def test_pointer_pattern_is_exposed_in_schema():
+    properties = CopyOp.model_json_schema()["properties"]
+    assert properties["path"] == DictContaining(pattern=r"^(?:/(?:[^/~]|~[01])*)*$")
+    assert properties["from"] == DictContaining(pattern=r"^(?:/(?:[^/~]|~[01])*)*$")
 
 
 def test_additional_members_are_ignored():
@@ -182,14 +175,50 @@ def test_additional_members_are_ignored():
         pytest.param("/foo~1bar", ("foo/bar",), id="includes slash"),
         pytest.param("/foo~0bar", ("foo~bar",), id="includes tilde"),
         pytest.param("/foo~0123~1bar", ("foo~123/bar",), id="includes both"),
+        pytest.param("/~01", ("~1",), id="escaped tilde before one"),
     ],
 )
-def test_path_tokens_exposed(path: str, tokens: tuple[str, ...]):
-    op = CopyOp(from_=path, op="copy", path=path)  # ty: ignore[missing-argument,unknown-argument] -- ty can't follow the alias
+@pytest.mark.parametrize(
+    "build",
+    [
+        pytest.param(CopyOp, id="validated"),
+        pytest.param(CopyOp.model_construct, id="constructed"),
+    ],
+)
+def test_path_tokens_exposed(
+    build: tp.Callable[..., CopyOp], path: str, tokens: tuple[str, ...]
+):
+    op = build(from_=path, op="copy", path=path)
     assert op.from_tokens == tokens
     assert op.path_tokens == tokens
 
 
+def test_pointer_tokens_are_not_fields():
+    op = CopyOp.create(path="/a/b", from_="/c")
+    assert (op.path_tokens, op.from_tokens) == (("a", "b"), ("c",))
+    assert dict(op) == {"from_": "/c", "op": "copy", "path": "/a/b"}
+
+
+def test_pointer_tokens_follow_copied_pointers():
+    op = CopyOp.create(path="/a", from_="/b")
+    assert (op.path_tokens, op.from_tokens) == (("a",), ("b",))
+    copied = op.model_copy(update={"from_": "/y", "path": "/x"})
+    assert (copied.path_tokens, copied.from_tokens) == (("x",), ("y",))
+    restored = copied.model_copy(update={"from_": "/b", "path": "/a"})
+    assert (restored.path_tokens, restored.from_tokens) == (("a",), ("b",))
+
+
+def test_pointer_tokens_are_kept_per_op():
+    count = _CACHE_SIZE + 1
+    ops = [CopyOp.create(path=f"/a/{i}", from_=f"/b/{i}") for i in range(count)]
+    first = [(op.path_tokens, op.from_tokens) for op in ops]
+    assert first == [(("a", str(i)), ("b", str(i))) for i in range(count)]
+    assert all(
+        op.path_tokens is path_tokens and op.from_tokens is from_tokens
+        for op, (path_tokens, from_tokens) in zip(ops, first, strict=True)
+    )
+
+
 def test_models_are_immutable():
     patch = JsonPatch(
         [TestOp[list[str]].create(path=("foo", "bar"), value=["baz", "qux"])],
@@ -272,6 +301,17 @@ def test_json_patch_can_be_created_from_tuple():
     assert len(patch) == 1
 
 
+def test_json_patch_requires_a_sequence():
+    with pytest.raises(ValidationError, match="instance of Sequence"):
+        JsonPatch({RemoveOp.create(path="/foo")})
+
+
+def test_json_patch_requires_an_array_when_parsed():
+    with pytest.raises(ValidationError) as excinfo:
+        JsonPatch.model_validate_json('{"op": "remove", "path": "/foo"}')
+    assert [error["type"] for error in excinfo.value.errors()] == ["list_type"]
+
+
 def test_json_patch_root_is_immutable():
     patch = JsonPatch([RemoveOp.create(path="/foo")])
     with pytest.raises(TypeError):
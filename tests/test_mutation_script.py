@@ -0,0 +1,138 @@
+import importlib.util
+import pathlib
+import sqlite3
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+
+import pytest
+from cosmic_ray import commands
+from cosmic_ray.work_db import WorkDB, use_db
+from cosmic_ray.work_item import (
+    TestOutcome,
+    WorkerOutcome,
+    WorkItem,
+    WorkResult,
+)
+
+MUTATION_SCRIPT: pathlib.Path = (
+    pathlib.Path(__file__).resolve().parent.parent / "bin" / "mutation.py"
+)
+
+
+def test_tune_for_writes_switches_to_wal(mutation: ModuleType, tmp_path: pathlib.Path):
+    db_path = tmp_path / "tuned.sqlite"
+    with use_db(db_path, mode=WorkDB.Mode.create) as db:
+        mutation.tune_for_writes(db)
+        db.add_work_item(WorkItem(job_id="job", mutations=()))
+        connection = sqlite3.connect(db_path)
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        finally:
+            connection.close()
+
+
+def test_batched_results_are_flushed(mutation: ModuleType, tmp_path: pathlib.Path):
+    result = WorkResult(
+        worker_outcome=WorkerOutcome.NORMAL,
+        test_outcome=TestOutcome.KILLED,
+    )
+    with use_db(tmp_path / "batched.sqlite", mode=WorkDB.Mode.create) as db:
+        for job_id in ("first", "second", "third"):
+            db.add_work_item(WorkItem(job_id=job_id, mutations=()))
+        with mutation.batched_results(db, size=2) as record:
+            record("first", result)
+            assert db.num_results == 0
+            record("second", result)
+            assert db.num_results == 2
+            record("third", result)
+            assert db.num_results == 2
+        assert db.num_results == 3
+
+
+def test_parallel_distributor_mutates_copies(
+    mutation: ModuleType, tmp_path: pathlib.Path
+):
+    module_path = mutation.ROOT / "src" / "pydantic_json_patch" / "models.py"
+    original = module_path.read_bytes()
+    with use_db(tmp_path / "parallel.sqlite", mode=WorkDB.Mode.create) as db:
+        commands.init(
+            module_paths=[module_path],
+            work_db=db,
+            operator_cfgs=mutation.config_dict.operators_config,
+        )
+        work_items = list(db.pending_work_items)[:2]
+        results = {}
+        mutation.ParallelDistributor(workers=2)(
+            work_items,
+            f"{sys.executable} -c pass",
+            30.0,
+            {},
+            results.__setitem__,
+        )
+    assert sorted(results) == sorted(item.job_id for item in work_items)
+    assert all(
+        result.test_outcome == TestOutcome.SURVIVED and result.diff
+        for result in results.values()
+    )
+    assert module_path.read_bytes() == original
+
+
+def test_sample_is_repeatable(mutation: ModuleType, tmp_path: pathlib.Path):
+    module_path = tmp_path / "example.py"
+    module_path.write_text(
+        "def f(a, b):\n    return a + b if a < b else (a - b) * 2 // 3\n"
+    )
+    samples = []
+    for name in ("first", "second"):
+        with use_db(tmp_path / f"{name}.sqlite", mode=WorkDB.Mode.create) as db:
+            commands.init(
+                module_paths=[module_path],
+                work_db=db,
+                operator_cfgs=mutation.config_dict.operators_config,
+            )
+            mutation.sample_work(db, rate=0.5)
+            samples.append(
+                {
+                    (mutation_.operator_name, mutation_.occurrence)
+                    for work_item in db.pending_work_items
+                    for mutation_ in work_item.mutations
+                }
+            )
+            num_work_items = db.num_work_items
+    assert 0 < len(samples[0]) < num_work_items
+    assert samples[0] == samples[1]
+
+
+def test_skipped_results_are_not_counted(mutation: ModuleType, tmp_path: pathlib.Path):
+    with use_db(tmp_path / "results.sqlite", mode=WorkDB.Mode.create) as db:
+        for job_id in ("skipped", "survived"):
+            db.add_work_item(WorkItem(job_id=job_id, mutations=()))
+        db.set_result(
+            "skipped",
+            WorkResult(output="Sampled out", worker_outcome=WorkerOutcome.SKIPPED),
+        )
+        db.set_result(
+            "survived",
+            WorkResult(
+                worker_outcome=WorkerOutcome.NORMAL,
+                test_outcome=TestOutcome.SURVIVED,
+            ),
+        )
+        assert [result.test_outcome for result in mutation.tested_results(db)] == [
+            TestOutcome.SURVIVED
+        ]
+
+
+@pytest.fixture(name="mutation", scope="module")
+def _load_mutation_script() -> Iterator[ModuleType]:
+    spec = importlib.util.spec_from_file_location("mutation", MUTATION_SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # register and expose the module, so spawned workers can import it by name
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setitem(sys.modules, "mutation", module)
+        patch.syspath_prepend(MUTATION_SCRIPT.parent)
+        spec.loader.exec_module(module)
+        yield module
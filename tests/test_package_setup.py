@@ -5,6 +5,10 @@ import pytest
 
 from pydantic_json_patch import __version__
 
+PYPROJECT_TOML: pathlib.Path = (
+    pathlib.Path(__file__).resolve().parent.parent / "pyproject.toml"
+)
+
 
 @pytest.mark.skipif(
     sys.version_info < (3, 11),
@@ -13,7 +17,6 @@ from pydantic_json_patch import __version__
 def test_version_exposed():
     import tomllib  # ty: ignore[unresolved-import] -- only runs in py3.10+  # noqa: PLC0415
 
-    pyproject_toml = pathlib.Path(__file__).parent / ".." / "pyproject.toml"
-    with pyproject_toml.open("rb") as f:
+    with PYPROJECT_TOML.open("rb") as f:
         data = tomllib.load(f)
     assert data["project"]["version"] == __version__